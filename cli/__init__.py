@@ -3,13 +3,18 @@ import typing
 
 import click
 
-from cli.git import checkout_ticket
-from cli.new import new_ticket
-from cli.search import search_tickets
+from cli.lazy import LazyGroup
 from gira import ticket_store
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "new": "cli.new.new_ticket",
+        "search": "cli.search.search_tickets",
+        "checkout": "cli.git.checkout_ticket",
+    },
+)
 @click.option(
     "-d",
     "--tickets-dir",
@@ -22,8 +27,3 @@ from gira import ticket_store
 def cli(context: click.Context, tickets_dir: typing.Optional[pathlib.Path]):
     """A barebones ticketing system for `git`"""
     context.obj = ticket_store.TicketStore(tickets_dir)
-
-
-cli.add_command(new_ticket)
-cli.add_command(search_tickets)
-cli.add_command(checkout_ticket)
@@ -12,13 +12,28 @@ O = typing.TypeVar("O")
 GenericClickCallback = collections.abc.Callable[[click.Context, click.Parameter, V], O]
 
 
+def _none_passthrough(
+    callback: collections.abc.Callable[[V], O], value: typing.Optional[V]
+) -> typing.Optional[O]:
+    """Apply a function to a value, unless that value is `None`"""
+    return callback(value) if value is not None else None
+
+
 def none_passthrough(
     callback: collections.abc.Callable[[V], O]
 ) -> collections.abc.Callable[[typing.Optional[V]], typing.Optional[O]]:
     """Wrap a function to return the input value if it's `None`"""
-    return functools.wraps(callback)(
-        lambda value: callback(value) if value is not None else None
-    )
+    return functools.partial(_none_passthrough, callback)
+
+
+def _plain_callback(
+    callback: collections.abc.Callable[[V], O],
+    context: click.Context,
+    parameter: click.Parameter,
+    value: V,
+) -> O:
+    """Apply a function to only the value passed to a `click` callback"""
+    return callback(value)
 
 
 def plain_callback(callback: collections.abc.Callable[[V], O]) -> GenericClickCallback:
@@ -31,48 +46,69 @@ def plain_callback(callback: collections.abc.Callable[[V], O]) -> GenericClickCa
     Args:
         callback: The function to wrap
     """
-    return functools.wraps(callback)(lambda context, parameter, value: callback(value))
+    return functools.partial(_plain_callback, callback)
+
+
+def _mapped_callback(
+    callback: GenericClickCallback,
+    condition: typing.Optional[collections.abc.Callable[[V], bool]],
+    context: click.Context,
+    parameter: click.Parameter,
+    values: list[V],
+) -> list[O]:
+    """Apply a `click` callback to each of multiple values"""
+    if not values:
+        return []
+
+    # Most callbacks aren't conditional, so skip testing each value if possible
+    if condition is None:
+        return [callback(context, parameter, value) for value in values]
+
+    return [callback(context, parameter, value) for value in values if condition(value)]
 
 
 def mapped_callback(
     callback: GenericClickCallback,
-    condition: collections.abc.Callable[[V], bool] = lambda value: True,
+    condition: typing.Optional[collections.abc.Callable[[V], bool]] = None,
 ) -> collections.abc.Callable[[click.Context, click.Parameter, list[V]], list[O]]:
     """Maps a single-value `click` callback to multiple values
 
     Args:
         callback: The callback to wrap
         condition: An optional test to apply to the input value list, to exclude
-            elements whose return-value is falsy
+            elements whose return-value is falsy; if omitted, every value is
+            passed to the callback
     """
-    return functools.wraps(callback)(
-        lambda context, parameter, values: [
-            callback(context, parameter, value) for value in values if condition(value)
-        ]
-    )
+    return functools.partial(_mapped_callback, callback, condition)
 
 
-def _compose_callbacks(inner: GenericClickCallback, outer: GenericClickCallback):
-    """Pipe the output of an inner callback into the `value` parameter of an outer
+def _compose_callbacks(
+    callbacks: tuple[GenericClickCallback, ...],
+    context: click.Context,
+    parameter: click.Parameter,
+    value: typing.Any,
+) -> typing.Any:
+    """Pipe a value through a series of callbacks, in the order given
 
     Handles passing the context & parameter arguments to each callback in turn
-    """
 
-    @functools.wraps(outer)
-    def new_outer(context: click.Context, parameter: click.Parameter, value: V) -> O:
-        return outer(context, parameter, inner(context, parameter, value))
+    Note:
+        The value's type can change as it passes through each callback, so it
+        isn't more specifically annotated
+    """
+    for callback in callbacks:
+        value = callback(context, parameter, value)
 
-    return new_outer
+    return value
 
 
 def compose_callbacks(callbacks: list[GenericClickCallback]) -> GenericClickCallback:
     """Pipe a series of callbacks into eachother, sequentially
 
+    The last callback is applied first, and its output is passed to the one
+    before it, and so on, so that the first callback is the outermost.
+
     Handles passing the context & parameter arguments to each callback in turn
     """
-    return functools.wraps(callbacks[0])(
-        functools.reduce(
-            _compose_callbacks,
-            reversed(callbacks),
-        )
-    )
+    # Reversed once up front, so the callbacks can be applied in order on each call
+    return functools.partial(_compose_callbacks, tuple(reversed(callbacks)))
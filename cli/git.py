@@ -2,45 +2,44 @@ import functools
 import typing
 
 import click
-import git
 
-from gira import ticket, ticket_store
-
-
-def get_ticket(
-    context: click.Context,
-    parameter: click.Parameter,
-    value: int,
-) -> ticket.Ticket:
-    """Get the ticket corresponding to an input ticket number.
-
-    Errors out if the ticket doesn't exist
-    """
-    try:
-        return context.obj.get_ticket(value)
-    except ticket_store.NonexistentTicket:
-        raise click.BadParameter(f"Ticket #{value} cannot be found.")
+from gira import ticket_store
 
 
 @click.command(name="checkout")
 @click.option(
     "-n",
     "-number",
-    "target_ticket",
+    "number",
     type=int,
     required=True,
-    callback=get_ticket,
     help="The number of the ticket to check out.",
 )
-@click.pass_obj
-def checkout_ticket(store: ticket_store.TicketStore, target_ticket: ticket.Ticket):
+@click.pass_context
+def checkout_ticket(context: click.Context, number: int):
     """Check out a ticket's branch.
 
     If the corresponding branch doesn't exist, it will be created.
     """
-    typing.cast(
-        git.Head, store.repo_manager.get_branch(target_ticket.git_branch)
-    ).checkout()
+    store: ticket_store.TicketStore = context.obj
+
+    try:
+        target_ticket = store.get_ticket(number)
+    except ticket_store.NonexistentTicket:
+        # Attribute the error to the number option, so `click` describes it the
+        # same way as an error raised by that option's own callback
+        number_option = next(
+            param for param in context.command.params if param.name == "number"
+        )
+        raise click.BadParameter(
+            f"Ticket #{number} cannot be found.", ctx=context, param=number_option
+        )
+
+    branch = store.repo_manager.get_branch(target_ticket.git_branch)
+    # Since the branch is created if it's missing, it can't be `None`
+    assert branch is not None
+
+    branch.checkout()
 
 
 COMMIT_FLAG_NAME = "commit"
@@ -51,11 +50,19 @@ commit_flag = functools.partial(
     "--commit/--no-commit",
     COMMIT_FLAG_NAME,
     default=False,
+    # Processed before any other options, since their callbacks depend on it
+    is_eager=True,
     show_default=True,
 )
 
 
 def committing(context: click.Context) -> bool:
+    """Has the user requested that modifications be committed?
+
+    Note:
+        The commit flag is eager, so it's always been processed by the time
+        any other option's callback checks it
+    """
     return context.params[COMMIT_FLAG_NAME]
 
 
@@ -73,7 +80,9 @@ def validate_committing_nontickets(
     Raises:
         BadParameter
     """
-    if not value and committing(context) and context.obj.staged_nonticket_files:
+    store = context.obj
+
+    if not value and committing(context) and store.staged_nonticket_files:
         raise click.BadParameter("There are staged files that don't contain tickets.")
 
     # Don't need to return because this parameter is not exposed
@@ -91,7 +100,10 @@ commit_nonticket_flag = click.option(
 
 def format_ticket_numbers(ticket_numbers: list[int]) -> str:
     """Format a list of ticket numbers"""
-    return ", ".join(f"#{ticket_number}" for ticket_number in ticket_numbers)
+    if not ticket_numbers:
+        return ""
+
+    return "#" + ", #".join(map(str, ticket_numbers))
 
 
 def validate_committing_with_unstaged_tickets(
@@ -108,9 +120,11 @@ def validate_committing_with_unstaged_tickets(
     Raises:
         BadParameter
     """
-    if not value and committing(context) and context.obj.unstaged_ticket_numbers:
+    store = context.obj
+
+    if not value and committing(context) and store.unstaged_ticket_numbers:
         raise click.BadParameter(
-            f"There are unstaged ticket files: {format_ticket_numbers(context.obj.unstaged_ticket_numbers)}."
+            f"There are unstaged ticket files: {format_ticket_numbers(store.unstaged_ticket_numbers)}."
         )
 
     # Don't need to return because this parameter is not exposed
@@ -0,0 +1,45 @@
+import importlib
+import typing
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A command group whose subcommands are only imported when they're needed
+
+    Based on the lazy-loading recipe from the `click` documentation: importing
+    a subcommand's module (and, transitively, its dependencies) is deferred
+    until that subcommand is actually requested.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: typing.Optional[dict[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            lazy_subcommands: A map from subcommand names to the import paths of
+                those commands, in the form `package.module.attribute`
+        """
+        super().__init__(*args, **kwargs)
+
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, context: click.Context) -> list[str]:
+        return sorted([*super().list_commands(context), *self.lazy_subcommands])
+
+    def get_command(
+        self, context: click.Context, command_name: str
+    ) -> typing.Optional[click.Command]:
+        if command_name in self.lazy_subcommands:
+            return self._load_command(command_name)
+
+        return super().get_command(context, command_name)
+
+    def _load_command(self, command_name: str) -> click.Command:
+        """Import a lazily-loaded subcommand"""
+        module_name, attribute_name = self.lazy_subcommands[command_name].rsplit(".", 1)
+
+        return getattr(importlib.import_module(module_name), attribute_name)
@@ -1,4 +1,5 @@
 import collections
+import os
 import pathlib
 import typing
 
@@ -8,13 +9,12 @@ from cli.callbacks import compose_callbacks, mapped_callback, plain_callback
 from cli.git import ticket_commit_options
 from cli.validation import (
     add_terminal_newline_to_description,
+    new_ticket_relationships,
     parse_ticket_status,
     parse_ticket_work_type,
     relativize_group,
-    ticket_relationship_choice,
     ticket_status_choice,
     ticket_work_type_choice,
-    validate_ticket_relationship_creation,
 )
 from gira import ticket, ticket_properties, ticket_store
 
@@ -33,26 +33,14 @@ def validate_new_ticket_number(
     if value is None:
         return store.next_ticket_number
 
-    try:
-        ticket_path = store.ticket_path_components_by_number[value]
+    # Only look for the specific ticket, rather than indexing all of them
+    ticket_path = store.find_ticket_path_components(value)
+    if ticket_path is not None:
         raise click.BadParameter(
             message=f"Ticket #{value} already exists: {ticket_path}.",
         )
-    # A `KeyError` indicates that the ticket isn't in the ticket store, so it's
-    # OK to use
-    except KeyError:
-        return value
-
-
-new_ticket_relationships = click.option(
-    "-r",
-    "--relationship",
-    "relationships",
-    multiple=True,
-    type=(int, ticket_relationship_choice, str),
-    callback=validate_ticket_relationship_creation,
-    help="A relationship to give the ticket.",
-)
+
+    return value
 
 
 @click.command(name="new")
@@ -150,13 +138,17 @@ def new_ticket(
         relationships=relationships,
     )
 
-    relative_ticket_path = store.relative_ticket_path(new_ticket)
+    relative_ticket_path = str(store.relative_ticket_path(new_ticket))
 
     # Create the ticket storage directory; noop if it already exists
-    relative_ticket_path.parent.mkdir(parents=True, exist_ok=True)
+    # The path will have no directory component if the ticket storage directory
+    # is the current working directory
+    ticket_dir = os.path.dirname(relative_ticket_path)
+    if ticket_dir:
+        os.makedirs(ticket_dir, exist_ok=True)
 
     # Error out if the file already exists
-    with relative_ticket_path.open(mode="x") as new_ticket_file:
+    with open(relative_ticket_path, mode="x") as new_ticket_file:
         new_ticket_file.write(new_ticket.document)
 
     # Optionally echo the path to the ticket
@@ -165,7 +157,7 @@ def new_ticket(
 
     # Optionally open the file
     if edit:
-        click.edit(filename=str(relative_ticket_path))
+        click.edit(filename=relative_ticket_path)
 
     # Optionally stage the file
     # (automatically set to `True` if we're committing)
@@ -1,9 +1,9 @@
+import collections
 import typing
 
 import click
-import tabulate
 
-from cli import git, new, validation
+from cli import git, validation
 from gira import ticket, ticket_properties, ticket_store
 
 
@@ -11,7 +11,7 @@ def error_on_empty_target_list(
     context: click.Context, parameter: click.Parameter, value: bool
 ) -> None:
     """Error out if requested and no tickets were found"""
-    if value and not context.obj.filtered_tickets:
+    if value and not context.obj.count_filtered_tickets(limit=1):
         raise click.BadParameter(f"No tickets matched the search criteria.")
 
 
@@ -25,60 +25,156 @@ error_none_found = click.option(
 )
 
 
+def format_table(
+    rows: collections.abc.Iterable[tuple[typing.Any, ...]]
+) -> collections.abc.Iterator[str]:
+    """Format rows of values as the lines of a plain-text table
+
+    Columns are separated by two spaces & padded to the width of their widest
+    cell. Columns containing only integers are right-aligned; all others are
+    left-aligned. `None` values are displayed as blanks.
+    """
+    rows = list(rows)
+
+    right_aligned = [
+        all(isinstance(cell, int) for cell in column if cell is not None)
+        for column in zip(*rows)
+    ]
+    cell_rows = [["" if cell is None else str(cell) for cell in row] for row in rows]
+    widths = [max(map(len, column)) for column in zip(*cell_rows)]
+
+    for cell_row in cell_rows:
+        yield "  ".join(
+            cell.rjust(width) if right else cell.ljust(width)
+            for cell, width, right in zip(cell_row, widths, right_aligned)
+        ).rstrip()
+
+
+def ticket_listing_row(
+    found_ticket: ticket.Ticket, existing_branches: set[str]
+) -> tuple[typing.Any, ...]:
+    """The properties of a ticket to display in a listing
+
+    `None` is used for any missing properties, so they're displayed as blanks
+
+    Args:
+        found_ticket: The ticket to display
+        existing_branches: The names of all the branches in the repo
+    """
+    status = found_ticket.status
+    work_type = found_ticket.work_type
+    git_branch = found_ticket.git_branch
+
+    return (
+        status.name if status else None,
+        work_type.name if work_type else None,
+        found_ticket.number,
+        found_ticket.title,
+        found_ticket.group,
+        found_ticket.related_ticket_numbers or None,
+        git_branch if git_branch in existing_branches else None,
+    )
+
+
 @click.command(name="list")
 @click.pass_obj
 def list_tickets(store: ticket_store.TicketStore):
     """List matching tickets and their properties."""
-    click.echo(
-        tabulate.tabulate(
-            (
-                (
-                    found_ticket.status.name
-                    if found_ticket.status
-                    else found_ticket.status,
-                    found_ticket.work_type.name
-                    if found_ticket.work_type
-                    else found_ticket.work_type,
-                    found_ticket.number,
-                    found_ticket.title,
-                    found_ticket.group,
-                    # `None` results in a blank for empty related ticket lists
-                    found_ticket.related_ticket_numbers or None,
-                    # `None` results in a blank for nonexistent branches
-                    found_ticket.git_branch
-                    if store.repo_manager.branch_exists(found_ticket.git_branch)
-                    else None,
-                )
-                for found_ticket in store.filtered_tickets
-            ),
-            tablefmt="plain",
-        )
+    # An empty table is still displayed, as a blank line
+    if not store.filtered_tickets:
+        click.echo()
+        return
+
+    # Look up all the branches at once, rather than checking whether each
+    # ticket's branch exists separately
+    existing_branches = store.repo_manager.branch_names
+
+    table_lines = format_table(
+        ticket_listing_row(found_ticket, existing_branches)
+        for found_ticket in store.filtered_tickets
     )
 
+    # Write the table in chunks, rather than writing & flushing each line or
+    # building the whole table as a single string
+    for chunk in chunk_lines(table_lines):
+        click.echo(chunk, nl=False)
+
 
 @click.command()
 @click.pass_obj
 @error_none_found
 def stage(store: ticket_store.TicketStore):
     """Stage any changes to matching tickets."""
-    for found_ticket in store.filtered_tickets:
-        store.stage(found_ticket)
+    store.stage_many(store.filtered_tickets)
 
 
 def handle_page_on_single_tickets(
     context: click.Context, parameter: click.Parameter, value: bool
 ) -> bool:
     """Page on single tickets only if requested"""
-    if len(context.obj.filtered_tickets) == 1:
-        return (
-            value
-            and not context.get_parameter_source("pager")
-            == click.core.ParameterSource.DEFAULT
+    if context.obj.count_filtered_tickets(limit=2) == 1:
+        is_default = (
+            context.get_parameter_source("pager") is click.core.ParameterSource.DEFAULT
         )
+        return value and not is_default
     else:
         return value
 
 
+# The minimum size of the chunks of text written out at once
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+
+def chunk_lines(
+    lines: collections.abc.Iterable[str],
+    chunk_size: int = OUTPUT_CHUNK_SIZE,
+    newlines: bool = True,
+) -> collections.abc.Iterator[str]:
+    """Join lines of text into chunks, for incremental display
+
+    Lines are accumulated until they reach the chunk size, so that fewer, larger
+    writes are made, without holding all of the output in memory at once.
+
+    Args:
+        lines: The lines of text to join
+        chunk_size: The minimum size of each chunk, except the last
+        newlines: Should each line be followed by a newline, to match the output
+            of `click.echo`? If not, the lines are joined as they are.
+    """
+    separator = "\n" if newlines else ""
+    chunk: list[str] = []
+    current_chunk_size = 0
+
+    for line in lines:
+        chunk += [line, separator]
+        current_chunk_size += len(line) + len(separator)
+
+        if current_chunk_size >= chunk_size:
+            yield "".join(chunk)
+
+            chunk = []
+            current_chunk_size = 0
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def stream_documents(
+    tickets: collections.abc.Iterable[ticket.Ticket],
+    chunk_size: int = OUTPUT_CHUNK_SIZE,
+) -> collections.abc.Iterator[str]:
+    """Yield the documents of tickets in chunks, for incremental display
+
+    The documents are output exactly as they are, without separating newlines,
+    as `click.echo_via_pager` would for the documents themselves
+    """
+    return chunk_lines(
+        (found_ticket.document for found_ticket in tickets),
+        chunk_size=chunk_size,
+        newlines=False,
+    )
+
+
 @click.command()
 @click.option(
     "-p/-P",
@@ -90,12 +186,20 @@ def handle_page_on_single_tickets(
 @click.pass_obj
 def show(store: ticket_store.TicketStore, pager: bool):
     """Display the contents of matching tickets."""
-    documents = (ticket.document for ticket in store.filtered_tickets)
     if pager:
-        click.echo_via_pager(documents)
+        # Tickets are loaded & rendered as their documents are generated, rather
+        # than all being loaded up front; the pager is sent their documents in
+        # chunks, so for most ticket sets nothing is displayed until every
+        # matching ticket has been read
+        click.echo_via_pager(stream_documents(store.iter_filtered_tickets()))
     else:
-        for document in documents:
-            click.echo(document)
+        documents = [
+            found_ticket.document for found_ticket in store.iter_filtered_tickets()
+        ]
+
+        # Output all the documents at once, rather than writing each separately
+        if documents:
+            click.echo("\n".join(documents))
 
 
 def handle_multiple_found_tickets(
@@ -105,7 +209,7 @@ def handle_multiple_found_tickets(
 
     `value` should be a bool indicating whether more than one ticket is acceptable
     """
-    if value and len(context.obj.filtered_tickets) > 1:
+    if value and context.obj.count_filtered_tickets(limit=2) > 1:
         raise click.BadParameter("Multiple tickets matched the search criteria.")
 
     return value
@@ -154,8 +258,8 @@ def edit(store: ticket_store.TicketStore, stage: bool, commit: bool):
     for found_ticket in store.filtered_tickets:
         click.edit(filename=str(store.relative_ticket_path(found_ticket)))
 
-        if stage:
-            store.stage(found_ticket)
+    if stage:
+        store.stage_many(store.filtered_tickets)
 
     if commit:
         commit_modifications(store)
@@ -211,7 +315,7 @@ def set_properties(
         if work_type:
             found_ticket.work_type = work_type
 
-        store.write(found_ticket, stage)
+    store.write_many(store.filtered_tickets, stage)
 
     if commit:
         commit_modifications(store)
@@ -220,7 +324,7 @@ def set_properties(
 @click.command()
 @check_single_found_ticket
 @error_none_found
-@new.new_ticket_relationships
+@validation.new_ticket_relationships
 @commit_modifications_options
 @click.pass_obj
 def add(
@@ -232,10 +336,11 @@ def add(
     """Add new field elements to matching tickets."""
     for found_ticket in store.filtered_tickets:
         for relationship, tickets_to_labels in relationships.items():
-            for ticket_number, label in tickets_to_labels.items():
-                found_ticket.relationships[relationship][ticket_number] = label
+            found_ticket.relationships.setdefault(relationship, {}).update(
+                tickets_to_labels
+            )
 
-        store.write(found_ticket, stage)
+    store.write_many(store.filtered_tickets, stage)
 
     if commit:
         commit_modifications(store)
@@ -4,8 +4,11 @@ import re
 
 import click
 
-from cli.callbacks import mapped_callback, plain_callback
+from cli.callbacks import compose_callbacks, mapped_callback, plain_callback
+from cli.lazy import LazyGroup
 from cli.validation import (
+    compile_search_pattern,
+    is_excluded_status,
     parse_ticket_status,
     parse_ticket_work_type,
     relativize_group,
@@ -29,7 +32,17 @@ search_group = functools.partial(
 )
 search_regex = functools.partial(
     search_option,
-    callback=mapped_callback(plain_callback(re.compile)),
+    # Patterns are compiled once, here, when the options are parsed: the search
+    # conditions only ever hold compiled patterns, which are applied to each
+    # ticket with `Pattern.search`. Each option's patterns are also compiled
+    # into a single pattern where possible, so each ticket only needs to be
+    # searched once per option
+    callback=compose_callbacks(
+        [
+            plain_callback(ticket_store.combine_patterns),
+            mapped_callback(compile_search_pattern),
+        ]
+    ),
 )
 
 search_relationship = functools.partial(
@@ -39,7 +52,19 @@ search_relationship = functools.partial(
 )
 
 
-@click.group(name="search", invoke_without_command=True)
+@click.group(
+    name="search",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "list": "cli.search.commands.list_tickets",
+        "show": "cli.search.commands.show",
+        "edit": "cli.search.commands.edit",
+        "set": "cli.search.commands.set_properties",
+        "add": "cli.search.commands.add",
+        "stage": "cli.search.commands.stage",
+    },
+    invoke_without_command=True,
+)
 @search_number(
     "-n",
     "--number",
@@ -79,9 +104,7 @@ search_relationship = functools.partial(
     type=ticket_exclude_status_choice,
     default=[ticket_properties.TicketStatus.DONE.name],
     show_default=True,
-    callback=mapped_callback(
-        parse_ticket_status, lambda value: value != ticket_exclude_status_remove_default
-    ),
+    callback=mapped_callback(parse_ticket_status, is_excluded_status),
     help=(
         "Exclude tickets with one of these statuses. "
         f"Pass `{ticket_exclude_status_remove_default}` to bypass the default exclusion."
@@ -207,5 +230,5 @@ def search_tickets(
 
     # Default to echoing relative paths
     if context.invoked_subcommand is None:
-        for found_ticket in store.filtered_tickets:
+        for found_ticket in store.iter_filtered_tickets():
             click.echo(store.relative_ticket_path(found_ticket))
@@ -1,6 +1,7 @@
-import collections
 import enum
+import functools
 import pathlib
+import re
 import typing
 
 import click
@@ -41,11 +42,27 @@ def relativize_group(
         return value
 
 
+@plain_callback
+def compile_search_pattern(value: str) -> re.Pattern:
+    """Compile a search pattern into a regex
+
+    Raises:
+        BadParameter: If the pattern isn't a valid regex
+    """
+    try:
+        return re.compile(value)
+    except re.error as error:
+        raise click.BadParameter(f"{value!r} is not a valid regex ({error}).")
+
+
+@functools.lru_cache(maxsize=None)
 def choice_from_enum(
     enum_type: typing.Type[enum.Enum], case_sensitive: bool = False
 ) -> click.Choice:
     """Constructs a `click` parameter choice from enum members
 
+    Since enums can't change, the choice is only constructed once per enum.
+
     Args:
         enum_type: The enum whose members to permit
         case_sensitive: Should the choice by case-sensitive?
@@ -63,7 +80,7 @@ ticket_work_type_choice = choice_from_enum(ticket_properties.TicketWorkType)
 @none_passthrough
 def parse_ticket_work_type(value: str) -> ticket_properties.TicketWorkType:
     """Parse the ticket work type choice into a proper enum member"""
-    return ticket_properties.TicketWorkType[value]
+    return ticket_properties.TICKET_WORK_TYPES_BY_NAME[value]
 
 
 ticket_status_choice = choice_from_enum(ticket_properties.TicketStatus)
@@ -74,15 +91,23 @@ ticket_exclude_status_choice = click.Choice(
 )
 
 
+def is_excluded_status(value: str) -> bool:
+    """Is an exclusion value an actual status, rather than the bypass marker?"""
+    return value != ticket_exclude_status_remove_default
+
+
 @plain_callback
 @none_passthrough
 def parse_ticket_status(value: str) -> ticket_properties.TicketStatus:
     """Parse the ticket status choice into a proper enum member"""
-    return ticket_properties.TicketStatus[value]
+    return ticket_properties.TICKET_STATUSES_BY_NAME[value]
 
 
 ticket_relationship_choice = choice_from_enum(ticket_properties.TicketRelationship)
 ticket_relationship_match_any = "ANY"
+# Negating the null flag is equivalent to ORing all of them
+# i.e. it corresponds to "ANY"
+any_ticket_relationship = ~ticket_properties.NO_TICKET_RELATIONSHIP
 ticket_relationship_search_choice = click.Choice(
     list(ticket_relationship_choice.choices) + [ticket_relationship_match_any],
     case_sensitive=False,
@@ -108,11 +133,9 @@ def validate_ticket_relationship(
         raise click.BadParameter(message=f"Ticket #{ticket_number} does not exist.")
 
     if raw_relationship == ticket_relationship_match_any:
-        # Negating the null flag is equivalent to ORing all of them
-        # i.e. it corresponds to "ANY"
-        relationship = ~ticket_properties.TicketRelationship(0)
+        relationship = any_ticket_relationship
     else:
-        relationship = ticket_properties.TicketRelationship[raw_relationship]
+        relationship = ticket_properties.TICKET_RELATIONSHIPS_BY_NAME[raw_relationship]
 
     return ticket_number, relationship
 
@@ -147,9 +170,15 @@ def build_ticket_relationship_map(
     relationships: list[TicketRelationshipTuple],
 ) -> ticket.RelationshipMap:
     """Construct a ticket relationship map"""
-    relationship_map: ticket.RelationshipMap = collections.defaultdict(dict)
+    relationship_map: ticket.RelationshipMap = {}
     for target_ticket_number, relationship, label in relationships:
-        relationship_map[relationship][target_ticket_number] = label
+        # Unlike `setdefault`, this doesn't create a throwaway dict for every
+        # relationship whose type has already been seen
+        target_tickets = relationship_map.get(relationship)
+        if target_tickets is None:
+            target_tickets = relationship_map[relationship] = {}
+
+        target_tickets[target_ticket_number] = label
 
     return relationship_map
 
@@ -157,3 +186,14 @@ def build_ticket_relationship_map(
 validate_ticket_relationship_creation = compose_callbacks(
     [build_ticket_relationship_map, validate_raw_ticket_relationships]
 )
+
+
+new_ticket_relationships = click.option(
+    "-r",
+    "--relationship",
+    "relationships",
+    multiple=True,
+    type=(int, ticket_relationship_choice, str),
+    callback=validate_ticket_relationship_creation,
+    help="A relationship to give the ticket.",
+)
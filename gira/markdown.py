@@ -1,23 +1,53 @@
+import functools
 import typing
 
-import marko
-import marko.md_renderer
+# `marko` is comparatively slow to import, & commands like `new` never parse or
+# render any markdown, so it's only imported by the functions that use it
+if typing.TYPE_CHECKING:
+    import marko
 
 
-def get_single_element_text(element: marko.block.BlockElement) -> str:
+def get_single_element_text(
+    element: "marko.element.Element",
+) -> typing.Union[str, list["marko.inline.InlineElement"]]:
     """Get the text from a single element
 
     Used for things like headings and paragraphs
+
+    Returns:
+        The contents of the element's first child, or an empty string if there
+        aren't any (e.g. for an empty heading, or an element like a thematic break
+        or an HTML block, which doesn't contain other elements). If the first
+        child isn't plain text (e.g. a heading that starts with emphasis), its
+        contents are a list of inline elements, rather than a string.
     """
-    return element.children[0].children
+    children = getattr(element, "children", None)
+    if not children:
+        return ""
+
+    return getattr(children[0], "children", "")
 
 
-def render_element_list(elements: list[marko.block.BlockElement]) -> str:
-    """Render a list of elements to text"""
+def render_element_list(elements: list["marko.element.Element"]) -> str:
+    """Render a list of elements to text
+
+    Note:
+        A new renderer is used for each call: entering one resets its state &
+        patches `html`'s character reference handling until it's exited, so a
+        single shared renderer can't safely be left open between calls
+    """
+    # Tickets often have no description or empty sections, so don't bother
+    # setting up a renderer when there's nothing to render
+    if not elements:
+        return ""
+
+    import marko.md_renderer
+
     with marko.md_renderer.MarkdownRenderer() as renderer:
         return "".join(renderer.render(element) for element in elements)
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_link_components(
     destination: str, title: typing.Optional[str]
 ) -> tuple[str, typing.Optional[str]]:
@@ -27,6 +57,9 @@ def parse_link_components(
     `link_ref_defs` map it creates doesn't fully parse out the destination &
     title of that link. This extracts those components so they can be used.
 
+    Tickets commonly link to the same tickets with the same relationship types,
+    so results are cached & recurring links are only parsed once.
+
     Args:
         destination: The incompletely-parsed destination string
         title: The incompletely-parsed title string, if any
@@ -36,6 +69,8 @@ def parse_link_components(
             1. The properly-parsed destination string
             2. The properly-parsed title string, if any
     """
+    import marko
+
     # If no title was matched in the ref def element, then we don't want to
     # erroneously create one when parsing it
     if title is not None:
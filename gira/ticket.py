@@ -1,4 +1,3 @@
-import collections
 import dataclasses
 import functools
 import itertools
@@ -6,11 +5,12 @@ import pathlib
 import re
 import typing
 
-import marko
-import slugify
-
 from gira import markdown, ticket_properties
 
+# Only needed to parse ticket documents, so it's imported when that happens
+if typing.TYPE_CHECKING:
+    import marko
+
 WORK_TYPE_UNION = "|".join(
     work_type.name for work_type in ticket_properties.TicketWorkType
 )
@@ -18,6 +18,54 @@ TICKET_HEADER_REGEX = re.compile(f"(?P<work_type>{WORK_TYPE_UNION}): (?P<title>.
 
 RelationshipMap = dict[ticket_properties.TicketRelationship, dict[int, str]]
 
+SLUG_MAX_LENGTH = 60
+SLUG_SEPARATOR = "-"
+# Commas between digits are dropped, rather than separating the numbers
+SLUG_NUMBER_COMMA_REGEX = re.compile(r"(?<=\d),(?=\d)")
+# Applied after lowercasing, so uppercase letters never need to be allowed
+SLUG_DISALLOWED_CHARACTERS_REGEX = re.compile(r"[^-a-z0-9]+")
+SLUG_DUPLICATE_SEPARATOR_REGEX = re.compile(r"-{2,}")
+
+
+def make_slug(text: str) -> str:
+    """Convert text into a slug suitable for filenames & branch names
+
+    The slug is truncated to `SLUG_MAX_LENGTH`, at a word boundary if possible.
+
+    Note:
+        Produces the same slugs as `slugify.slugify` with the settings used
+        for tickets. Plain ASCII text (the common case) is handled directly,
+        since `slugify` is comparatively expensive to import and run; anything
+        that needs transliteration, or that might contain an HTML entity,
+        is still handed off to `slugify`.
+    """
+    if not text.isascii() or "&" in text:
+        # Deferred because it's rarely needed & slow to import
+        import slugify
+
+        return slugify.slugify(
+            text,
+            max_length=SLUG_MAX_LENGTH,
+            word_boundary=True,
+            save_order=True,
+        )
+
+    slug = SLUG_NUMBER_COMMA_REGEX.sub("", text.lower())
+    slug = SLUG_DISALLOWED_CHARACTERS_REGEX.sub(SLUG_SEPARATOR, slug)
+    slug = SLUG_DUPLICATE_SEPARATOR_REGEX.sub(SLUG_SEPARATOR, slug).strip(
+        SLUG_SEPARATOR
+    )
+
+    if len(slug) <= SLUG_MAX_LENGTH:
+        return slug
+
+    # Cut just past the limit, so that a word ending exactly at the limit is
+    # kept, and then drop whatever partial word is left at the end
+    head, separator, _ = slug[: SLUG_MAX_LENGTH + 1].rpartition(SLUG_SEPARATOR)
+
+    # If the first word alone is too long, there's no boundary to cut at
+    return head if separator else slug[:SLUG_MAX_LENGTH]
+
 
 @dataclasses.dataclass
 class Ticket:
@@ -31,9 +79,7 @@ class Ticket:
     description: typing.Optional[str]
 
     sections: dict[str, str] = dataclasses.field(default_factory=dict)
-    relationships: RelationshipMap = dataclasses.field(
-        default_factory=lambda: collections.defaultdict(dict)
-    )
+    relationships: RelationshipMap = dataclasses.field(default_factory=dict)
 
     slug: typing.Optional[str] = None
     to_slug: dataclasses.InitVar[typing.Optional[str]] = None
@@ -41,12 +87,7 @@ class Ticket:
     def __post_init__(self, to_slug: str):
         if self.slug is None:
             if to_slug is not None:
-                self.slug = slugify.slugify(
-                    to_slug,
-                    max_length=60,
-                    word_boundary=True,
-                    save_order=True,
-                )
+                self.slug = make_slug(to_slug)
             else:
                 self.slug = ""
 
@@ -56,7 +97,9 @@ class Ticket:
         Args:
             group: The group to check
         """
-        return self.group is not None and self.group.is_relative_to(group)
+        return self.group is not None and ticket_properties.is_subpath(
+            self.group, group
+        )
 
     @property
     def full_slug(self) -> str:
@@ -85,12 +128,15 @@ class Ticket:
 
         return f"{work_type_prefix}{self.full_slug}"
 
-    @property
+    # The number, group & slug that make up a ticket's path aren't changed once
+    # it's been created, so the path components only need to be built once
+
+    @functools.cached_property
     def filename(self) -> pathlib.Path:
         """The filename for this ticket"""
         return pathlib.Path(f"{self.full_slug}{ticket_properties.TICKET_FILE_SUFFIX}")
 
-    @property
+    @functools.cached_property
     def path(self) -> pathlib.Path:
         """The path to the ticket file"""
         if self.group:
@@ -100,7 +146,7 @@ class Ticket:
 
     @staticmethod
     def extract_document_relationships(
-        document: marko.block.Document,
+        document: "marko.block.Document",
     ) -> RelationshipMap:
         """Get raw relationships from a ticket document
 
@@ -113,7 +159,7 @@ class Ticket:
                 1. The number of a target ticket
                 2. The label for the relationship to that target
         """
-        relationships: RelationshipMap = collections.defaultdict(dict)
+        relationships: RelationshipMap = {}
 
         # Only get relationships from link reference definitions, for now
         for label, (raw_destination, raw_title) in document.link_ref_defs.items():
@@ -127,24 +173,25 @@ class Ticket:
             except AttributeError:
                 continue
 
-            try:
-                relationship = ticket_properties.TicketRelationship[title]
+            relationship = ticket_properties.TICKET_RELATIONSHIPS_BY_NAME.get(title)
             # Indicates that the relationship isn't of a known type
-            except KeyError:
+            if relationship is None:
                 continue
 
             try:
-                relationships[relationship][int(destination)] = label
+                target_ticket_number = int(destination)
             # Indicates that the destination can't be parsed as an int (so it
             # can't possibly be a ticket number)
             except ValueError:
                 continue
 
+            relationships.setdefault(relationship, {})[target_ticket_number] = label
+
         return relationships
 
     @staticmethod
     def parse_markdown_document(
-        document: marko.block.Document,
+        document: "marko.block.Document",
     ) -> tuple[
         typing.Optional[ticket_properties.TicketStatus],
         typing.Optional[ticket_properties.TicketWorkType],
@@ -162,77 +209,51 @@ class Ticket:
                 4. The ticket description, if any
                 5. A map from section titles to section contents, if any
         """
-
-        children: collections.abc.Iterator[
-            marko.block.BlockElement
-        ] = itertools.filterfalse(
-            lambda element: isinstance(element, marko.block.BlankLine),
-            document.children,
-        )
-        children, children_for_grouping = itertools.tee(children)
-
-        INITIAL_THROWAWAY_VALUE = marko.block.BlockElement()
-        children_last_heading: collections.abc.Iterator[
-            marko.block.BlockElement
-        ] = itertools.accumulate(
-            children_for_grouping,
-            lambda previous_level, child: (
-                child if isinstance(child, marko.block.Heading) else previous_level
-            ),
-            initial=INITIAL_THROWAWAY_VALUE,
-        )
-        # `accumulate` will include the initial value, which breaks the alignment
-        # between the copies of `children`, so wrap it in a slice that drops the
-        # first element
-        children_last_heading = itertools.islice(
-            children_last_heading,
-            # Start at the first element & don't stop until the end is reached
-            1,
-            None,
-        )
+        import marko
 
         status = None
         title = None
         work_type = None
-        description = []
-        sections: dict[str, list[marko.block.BlockElement]] = {}
-
-        for child_group_last_heading, children_under_heading in itertools.groupby(
-            zip(children_last_heading, children),
-            key=lambda level_child_tuple: level_child_tuple[0],
-        ):
-            child_elements = [
-                child for children_last_heading, child in children_under_heading
-            ]
-
-            head = child_elements[0]
-            contents = child_elements[1:]
-
-            # Anything before the first heading is the ticket file header
-            if child_group_last_heading is INITIAL_THROWAWAY_VALUE:
-                try:
-                    # The first element in the header should be the ticket status
-                    status = ticket_properties.TicketStatus[
-                        markdown.get_single_element_text(head)
-                    ]
-                except (KeyError, TypeError):
-                    # If it isn't, treat it as a description
-                    description.append(head)
-                # Any remaining elements are counted as a description
-                description.extend(contents)
-            else:
-                heading_text = markdown.get_single_element_text(head)
+        description: list[marko.element.Element] = []
+        sections: dict[str, list[marko.element.Element]] = {}
+
+        # Anything before the first heading is the ticket file header, and is
+        # counted as description, as is any text following the first heading,
+        # until the next one
+        current_elements = description
+
+        children = (
+            child
+            for child in document.children
+            if not isinstance(child, marko.block.BlankLine)
+        )
 
-                # The first heading encountered will be treated as the ticket title,
-                # and any text following it, until the next heading, is the ticket
-                # description
+        for position, child in enumerate(children):
+            if isinstance(child, marko.block.Heading):
+                heading_text = markdown.get_single_element_text(child)
+                # Headings that start with inline markup (e.g. emphasis) aren't
+                # supported, since they can't be used as titles or section names
+                assert isinstance(heading_text, str)
+
+                # The first heading encountered will be treated as the ticket title
                 if title is None:
                     title = heading_text
-                    if contents:
-                        description.extend(contents)
-                # Anything after that is treated as a generic section
+                # Anything after that starts a generic section
                 else:
-                    sections[heading_text] = contents
+                    current_elements = sections[heading_text] = []
+            # The first element in the header should be the ticket status
+            elif position == 0:
+                status_text = markdown.get_single_element_text(child)
+                # The "text" may be a list of inline elements, which can't be a
+                # status name (and can't be looked up, since it's unhashable)
+                if isinstance(status_text, str):
+                    status = ticket_properties.TICKET_STATUSES_BY_NAME.get(status_text)
+
+                # If it isn't, treat it as a description
+                if status is None:
+                    description.append(child)
+            else:
+                current_elements.append(child)
 
         if title:
             title, work_type = Ticket.extract_title_and_work_type(title)
@@ -259,12 +280,10 @@ class Ticket:
                 1. The title, if any
                 2. The work type, if any
         """
-        try:
-            return None, ticket_properties.TicketWorkType[header]
-        # Indicates that the header isn't a bare work type (because it's not
-        # a member of the enum)
-        except KeyError:
-            pass
+        work_type = ticket_properties.TICKET_WORK_TYPES_BY_NAME.get(header)
+        # If there's no such member, the header isn't a bare work type
+        if work_type is not None:
+            return None, work_type
 
         match = TICKET_HEADER_REGEX.match(header)
         # If either field isn't matched, the match will be falsy
@@ -273,7 +292,7 @@ class Ticket:
             # that match group, we can directly cast the match to a member
             return (
                 match.group("title"),
-                ticket_properties.TicketWorkType[match.group("work_type")],
+                ticket_properties.TICKET_WORK_TYPES_BY_NAME[match.group("work_type")],
             )
 
         # Default to interpreting the header as a title without a work type
@@ -309,64 +328,58 @@ class Ticket:
     @property
     def document(self) -> str:
         """The contents of the ticket file"""
-        return "".join(
-            ([f"{self.status.name}", "\n\n"] if self.status else [])
-            + (
-                [f"# {self.title_and_type_header}", "\n"]
-                if self.title_and_type_header
-                else []
-            )
-            + (["\n", f"{self.description}"] if self.description else [])
-            # Format all sections
-            + list(
-                itertools.chain.from_iterable(
-                    ["\n", f"# {section}", "\n\n", f"{contents}"]
-                    for section, contents in self.sections.items()
-                )
-            )
-            # Format all relationships
-            + (
-                (
-                    ["\n"]
-                    + list(
-                        itertools.chain.from_iterable(
-                            itertools.chain.from_iterable(
-                                [
-                                    "\n",
-                                    f"[{link_label}]: {target_ticket_number} ({relationship.name})",
-                                ]
-                                for target_ticket_number, link_label in target_tickets.items()
-                            )
-                            for relationship, target_tickets in self.relationships.items()
-                        )
-                    )
-                    + ["\n"]
-                )
-                if self.relationships
-                else []
-            )
-        )
+        # The pieces are appended in order & joined once at the end, rather than
+        # concatenating intermediate lists for each part of the document
+        parts: list[str] = []
+
+        if self.status:
+            parts += [self.status.name, "\n\n"]
+
+        header = self.title_and_type_header
+        if header:
+            parts += [f"# {header}", "\n"]
+
+        if self.description:
+            parts += ["\n", self.description]
+
+        # Format all sections
+        for section, contents in self.sections.items():
+            parts += ["\n", f"# {section}", "\n\n", contents]
+
+        # Format all relationships
+        if self.relationships:
+            parts.append("\n")
+
+            for relationship, target_tickets in self.relationships.items():
+                for target_ticket_number, link_label in target_tickets.items():
+                    parts += [
+                        "\n",
+                        f"[{link_label}]: {target_ticket_number} ({relationship.name})",
+                    ]
+
+            parts.append("\n")
+
+        return "".join(parts)
 
     @functools.cached_property
     def inverted_relationships(self) -> dict[int, ticket_properties.TicketRelationship]:
         """A map from ticket numbers to a union of all relationships this ticket has with that ticket
 
-        Warning:
-            Because this uses a `defaultdict`, it cannot be used to list all the
-            tickets that this ticket has a relationship with, as `keys` will
-            erroneously include any ticket numbers that were checked during
-            searching
+        Only the tickets that this ticket actually has a relationship with are
+        included
         """
-        inverted_relationships: dict[
-            int, ticket_properties.TicketRelationship
-        ] = collections.defaultdict(lambda: ticket_properties.TicketRelationship(0))
+        inverted_relationships: dict[int, ticket_properties.TicketRelationship] = {}
 
         for relationship, tickets in self.relationships.items():
             for ticket in tickets:
-                # Since we've defaulted to the "NONE" condition, ORing each new
-                # relationship type will produce the union of all relationships
-                # with that ticket
-                inverted_relationships[ticket] |= relationship
+                # Starting from the "NONE" condition, ORing each new relationship
+                # type will produce the union of all relationships with that ticket
+                inverted_relationships[ticket] = (
+                    inverted_relationships.get(
+                        ticket, ticket_properties.NO_TICKET_RELATIONSHIP
+                    )
+                    | relationship
+                )
 
         return inverted_relationships
 
@@ -1,15 +1,37 @@
 import dataclasses
 import enum
+import functools
 import pathlib
 import re
 import typing
 
 TICKET_FILE_SUFFIX: str = ".gira.md"
+# Only the number & slug are captured: the other groups are non-capturing, so
+# matching doesn't record spans that are never used
 TICKET_FILE_REGEX: re.Pattern = re.compile(
-    f"(?P<number>\d+)(-(?P<slug>(\w+)(-\w+)*))?{re.escape(TICKET_FILE_SUFFIX)}"
+    rf"(?P<number>\d+)(?:-(?P<slug>\w+(?:-\w+)*))?{re.escape(TICKET_FILE_SUFFIX)}"
 )
 
 
+def is_subpath(path: pathlib.PurePath, parent: pathlib.PurePath) -> bool:
+    """Is a path the same as, or inside of, another path?
+
+    Equivalent to `path.is_relative_to(parent)`, but compares the paths' parts
+    directly rather than computing a relative path and catching the `ValueError`
+    raised when there isn't one
+
+    Args:
+        path: The path to check
+        parent: The path that might contain the other one
+    """
+    parent_parts = parent.parts
+    # Comparing anchors stops e.g. absolute paths being counted as inside `.`,
+    # which has no parts to compare against
+    return (
+        path.anchor == parent.anchor and path.parts[: len(parent_parts)] == parent_parts
+    )
+
+
 class MalformedTicket(Exception):
     """Raised when a ticket file can't be interpreted as a valid ticket"""
 
@@ -43,15 +65,23 @@ class PathComponents:
         except MalformedTicket:
             return False
 
-    @property
+    @functools.cached_property
     def group(self) -> typing.Optional[pathlib.Path]:
         """The group that the ticket is in"""
-        group: typing.Optional[pathlib.Path] = self.path.parent
+        group = self.path.parent
 
-        if group == pathlib.Path("."):
-            group = None
+        # Tickets directly in the ticket dir have `.` as their parent, which has
+        # no parts; checking that avoids creating a `.` path to compare against
+        return group if group.parts else None
 
-        return group
+    def is_in_group(self, group: pathlib.Path) -> bool:
+        """Is the ticket in a specific group?
+
+        Args:
+            group: The group to check
+        """
+        ticket_group = self.group
+        return ticket_group is not None and is_subpath(ticket_group, group)
 
     @property
     def filename(self) -> str:
@@ -72,17 +102,15 @@ class PathComponents:
         """
         match = TICKET_FILE_REGEX.match(path.name)
 
-        if match:
-            return cls(
-                path,
-                int(match.group("number")),
-                # Slugs are optional in ticket filenames: `slug` will be `None`
-                # if that group is missing from the match
-                match.group("slug"),
-            )
-        else:
+        if match is None:
             raise MalformedTicket(path)
 
+        # Slugs are optional in ticket filenames: `slug` will be `None` if that
+        # group is missing from the match
+        number, slug = match.group("number", "slug")
+
+        return cls(path, int(number), slug)
+
 
 @enum.unique
 class TicketStatus(enum.Enum):
@@ -98,6 +126,11 @@ class TicketStatus(enum.Enum):
     DONE = enum.auto()
 
 
+# A map from status names to members, for looking up statuses without going
+# through the enum's item access & raising on unknown names
+TICKET_STATUSES_BY_NAME: dict[str, TicketStatus] = dict(TicketStatus.__members__)
+
+
 @enum.unique
 class TicketRelationship(enum.Flag):
     """The relationships a ticket have with another ticket
@@ -127,6 +160,17 @@ class TicketRelationship(enum.Flag):
     FIXED_BY = enum.auto()
 
 
+# The "NONE" condition, i.e. the absence of any relationship, which is falsy when
+# ANDed with anything
+NO_TICKET_RELATIONSHIP = TicketRelationship(0)
+
+# A map from relationship names to members, for looking up relationships without
+# going through the enum's item access & raising on unknown names
+TICKET_RELATIONSHIPS_BY_NAME: dict[str, TicketRelationship] = dict(
+    TicketRelationship.__members__
+)
+
+
 @enum.unique
 class TicketWorkType(enum.Enum):
     """The types of work that a ticket can correspond to"""
@@ -137,3 +181,7 @@ class TicketWorkType(enum.Enum):
     TASK = enum.auto()
     # A ticket that fixes a bug
     BUG = enum.auto()
+
+
+# A map from work type names to members, like those for statuses & relationships
+TICKET_WORK_TYPES_BY_NAME: dict[str, TicketWorkType] = dict(TicketWorkType.__members__)
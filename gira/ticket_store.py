@@ -1,24 +1,98 @@
 import collections
+import concurrent.futures
 import dataclasses
 import functools
+import itertools
+import operator
 import os
 import pathlib
 import re
 import typing
 
-import git
-import marko
-
 from gira import ticket, ticket_properties
 
+if typing.TYPE_CHECKING:
+    import git
+
 # The individual items in ticket search inclusion & exclusion lists
 V = typing.TypeVar("V")
 
+# The fewest ticket files that are worth reading or writing concurrently; for
+# fewer, starting a thread pool costs more than it saves
+MIN_CONCURRENT_TICKET_FILES = 4
+
 
 # A combination of a target ticket number & a relationship with that ticket
 SpecificTicketRelationship = tuple[int, ticket_properties.TicketRelationship]
 
 
+def combine_patterns(patterns: list[re.Pattern]) -> list[re.Pattern]:
+    """Combine multiple regexes into one, which matches if any of them would
+
+    This means that a search only needs to make a single pass over the text,
+    rather than one pass per pattern.
+
+    Note:
+        Patterns that can't be safely joined into an alternation are returned
+        unchanged: those with capturing groups (whose backreferences would be
+        renumbered), those with differing flags, and those that can't be
+        recompiled once joined (e.g. because of inline global flags)
+
+    Returns:
+        A list containing either the single combined pattern or, if they can't
+        be combined, the original patterns
+    """
+    if len(patterns) < 2:
+        return patterns
+
+    flags = {pattern.flags for pattern in patterns}
+    if len(flags) > 1 or any(pattern.groups for pattern in patterns):
+        return patterns
+
+    try:
+        return [
+            re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+                flags.pop(),
+            )
+        ]
+    # Indicates that the patterns are valid individually but not when joined
+    except re.error:
+        return patterns
+
+
+def walk_ticket_files(directory: str) -> collections.abc.Iterator[str]:
+    """Recursively yield the paths of all the ticket files in a directory
+
+    This uses `os.scandir` directly, since the directory entries it produces
+    already know whether they're directories, and only creates paths for the
+    entries that are ticket files. Subdirectories are tracked on an explicit
+    stack, rather than by recursing through nested generators.
+
+    Note:
+        Symlinked directories are not followed
+
+    Args:
+        directory: The directory to search; if it doesn't exist, nothing will be
+            yielded
+    """
+    directories = collections.deque([directory])
+
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        # Indicates that the directory doesn't exist (yet), so it has no tickets
+        except FileNotFoundError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(ticket_properties.TICKET_FILE_SUFFIX):
+                    yield entry.path
+
+
 @dataclasses.dataclass
 class SearchConditions:
     """A container for searching collections of tickets"""
@@ -56,17 +130,20 @@ class SearchConditions:
             """
             ticket_number, relationship = specific_relationship
 
-            # The inverted relationships map defaults to the "NONE" condition,
-            # which is falsy when ANDed with anything. If a ticket being tested
-            # has one or more relationships with another target ticket, then
-            # the value will be the union of all those relationship types, which
-            # will be truthy when ANDed with any of those relationships (or the
-            # "ANY" condition, which is the union of all possible relationship
-            # types) and falsy when ANDed with a type that doesn't correspond to
-            # an existing relationship between the tested ticket and the target
-            # ticket
+            # Tickets missing from the inverted relationships map are treated as
+            # the "NONE" condition, which is falsy when ANDed with anything. If a
+            # ticket being tested has one or more relationships with another
+            # target ticket, then the value will be the union of all those
+            # relationship types, which will be truthy when ANDed with any of
+            # those relationships (or the "ANY" condition, which is the union of
+            # all possible relationship types) and falsy when ANDed with a type
+            # that doesn't correspond to an existing relationship between the
+            # tested ticket and the target ticket
             return bool(
-                test_ticket.inverted_relationships[ticket_number] & relationship
+                test_ticket.inverted_relationships.get(
+                    ticket_number, ticket_properties.NO_TICKET_RELATIONSHIP
+                )
+                & relationship
             )
 
         return ticket_relationship_predicate
@@ -86,47 +163,133 @@ class SearchConditions:
             exclude: The values to exclude; the condition check must be falsy for all
                 of these
         """
-        return (any(map(condition, include)) if include else True) and not any(
-            map(condition, exclude)
+        # Plain loops avoid creating `map` objects for every check, and return as
+        # soon as the outcome is known
+        if include:
+            for value in include:
+                if condition(value):
+                    break
+            else:
+                return False
+
+        for value in exclude:
+            if condition(value):
+                return False
+
+        return True
+
+    @staticmethod
+    def matching_membership(
+        value: V,
+        include: collections.abc.Container[V],
+        exclude: collections.abc.Container[V],
+    ) -> bool:
+        """Distribute inclusion & exclusion conditions for discrete values
+
+        This is equivalent to `matching_predicate` with an equality check as the
+        condition, but tests membership directly rather than applying the check
+        to each value in turn.
+
+        Args:
+            value: The value to test
+            include: The values to include; the test value must be one of these
+                (if there are any)
+            exclude: The values to exclude; the test value must not be any of
+                these
+        """
+        return (value in include if include else True) and value not in exclude
+
+    @staticmethod
+    def matching_patterns(
+        text: str, include: list[re.Pattern], exclude: list[re.Pattern]
+    ) -> bool:
+        """Distribute inclusion & exclusion patterns for ticket searching
+
+        Equivalent to `matching_predicate` with a condition that searches the
+        text for each pattern, but without creating a new condition for every
+        ticket tested
+
+        Args:
+            text: The text to search
+            include: The patterns to include; at least one must be found in the
+                text (if there are any)
+            exclude: The patterns to exclude; none of these may be found in the
+                text
+        """
+        if include and not any(pattern.search(text) for pattern in include):
+            return False
+
+        return not any(pattern.search(text) for pattern in exclude)
+
+    def path_matches(self, path_components: ticket_properties.PathComponents) -> bool:
+        """Could a ticket with these path components match the search criteria?
+
+        Only the conditions that can be checked from a ticket's path (its number,
+        group & slug) are tested, so tickets that can't match can be ruled out
+        without being loaded. Tickets that pass must still be checked with
+        `ticket_matches`.
+        """
+        return (
+            self.matching_membership(
+                path_components.number, self.numbers, self.exclude_numbers
+            )
+            and self.matching_predicate(
+                path_components.is_in_group, self.groups, self.exclude_groups
+            )
+            # Tickets without a slug in their filename are given an empty one
+            and self.matching_patterns(
+                path_components.slug or "", self.slugs, self.exclude_slugs
+            )
+        )
+
+    @property
+    def only_path_conditions(self) -> bool:
+        """Can the search criteria be checked from tickets' paths alone?
+
+        If so, any ticket that passes `path_matches` also passes `ticket_matches`,
+        so tickets only need to be loaded if their contents are actually needed.
+        """
+        return not (
+            self.statuses
+            or self.exclude_statuses
+            or self.work_types
+            or self.exclude_work_types
+            or self.titles
+            or self.exclude_titles
+            or self.descriptions
+            or self.exclude_descriptions
+            or self.relationships
+            or self.exclude_relationships
         )
 
     def ticket_matches(self, test_ticket: ticket.Ticket) -> bool:
         """Does a ticket match the configured search criteira?"""
+        # Conditions are checked from cheapest to most expensive, so that most
+        # non-matching tickets are rejected before the costlier checks are made
         return (
-            self.matching_predicate(
-                lambda number: test_ticket.number == number,
-                self.numbers,
-                self.exclude_numbers,
+            self.matching_membership(
+                test_ticket.number, self.numbers, self.exclude_numbers
             )
-            and self.matching_predicate(
-                lambda group: test_ticket.is_in_group(group),
-                self.groups,
-                self.exclude_groups,
+            and self.matching_membership(
+                test_ticket.status, self.statuses, self.exclude_statuses
             )
-            and self.matching_predicate(
-                lambda status: test_ticket.status is status,
-                self.statuses,
-                self.exclude_statuses,
+            and self.matching_membership(
+                test_ticket.work_type, self.work_types, self.exclude_work_types
             )
             and self.matching_predicate(
-                lambda work_type: test_ticket.work_type is work_type,
-                self.work_types,
-                self.exclude_work_types,
+                test_ticket.is_in_group, self.groups, self.exclude_groups
             )
-            and self.matching_predicate(
-                lambda regex: bool(regex.search(test_ticket.display_title)),
-                self.titles,
-                self.exclude_titles,
+            and self.matching_patterns(
+                test_ticket.display_title, self.titles, self.exclude_titles
             )
-            and self.matching_predicate(
-                lambda regex: bool(regex.search(test_ticket.description)),
+            # Tickets without a description or slug are treated as having empty ones
+            and self.matching_patterns(
+                test_ticket.description or "",
                 self.descriptions,
                 self.exclude_descriptions,
             )
-            and self.matching_predicate(
-                lambda regex: bool(regex.search(test_ticket.slug)),
-                self.slugs,
-                self.exclude_slugs,
+            and self.matching_patterns(
+                test_ticket.slug or "", self.slugs, self.exclude_slugs
             )
             and self.matching_predicate(
                 self.match_ticket_relationship(test_ticket),
@@ -163,30 +326,52 @@ class LazyTicketStore(dict):
         self.ticket_path_components_by_number = ticket_path_components_by_number
         self.tickets_dir = tickets_dir
 
-    def __missing__(self, key: int) -> ticket.Ticket:
-        # Attempts to get tickets for
-        path_components = self.ticket_path_components_by_number[key]
+    def read(self, number: int) -> str:
+        """Read the contents of a ticket's file
+
+        Raises:
+            KeyError: If the number doesn't correspond to an existing ticket
+        """
+        path_components = self.ticket_path_components_by_number[number]
 
-        # Parse the ticket file contents
         with open(self.tickets_dir / path_components.path) as ticket_file:
-            document = marko.parse(ticket_file.read())
-            (
-                status,
-                work_type,
-                title,
-                description,
-                sections,
-            ) = ticket.Ticket.parse_markdown_document(document)
-            raw_relationships = ticket.Ticket.extract_document_relationships(document)
+            return ticket_file.read()
+
+    def parse(self, number: int, contents: str) -> ticket.Ticket:
+        """Create a ticket from the contents of its file
+
+        Args:
+            number: The number of the ticket
+            contents: The contents of the ticket's file
+        """
+        # Deferred until a ticket is actually parsed, since it's slow to import
+        import marko
+
+        path_components = self.ticket_path_components_by_number[number]
+
+        # Parse the ticket file contents
+        document = marko.parse(contents)
+        (
+            status,
+            work_type,
+            title,
+            description,
+            sections,
+        ) = ticket.Ticket.parse_markdown_document(document)
+        raw_relationships = ticket.Ticket.extract_document_relationships(document)
 
         # Only include relationships to tickets that actually exist
-        relationships: ticket.RelationshipMap = collections.defaultdict(dict)
+        relationships: ticket.RelationshipMap = {}
         for relationship_type, target_tickets in raw_relationships.items():
-            for target_ticket_number, relationship_label in target_tickets.items():
-                if target_ticket_number in self.ticket_path_components_by_number:
-                    relationships[relationship_type][
-                        target_ticket_number
-                    ] = relationship_label
+            existing_target_tickets = {
+                target_ticket_number: relationship_label
+                for target_ticket_number, relationship_label in target_tickets.items()
+                if target_ticket_number in self.ticket_path_components_by_number
+            }
+
+            # Relationship types with no remaining targets are left out entirely
+            if existing_target_tickets:
+                relationships[relationship_type] = existing_target_tickets
 
         return ticket.Ticket(
             number=path_components.number,
@@ -200,32 +385,83 @@ class LazyTicketStore(dict):
             relationships=relationships,
         )
 
+    def __missing__(self, key: int) -> ticket.Ticket:
+        loaded_ticket = self.parse(key, self.read(key))
+        self[key] = loaded_ticket
+
+        return loaded_ticket
+
+    def load(self, numbers: collections.abc.Iterable[int]) -> None:
+        """Load multiple tickets at once
+
+        The files of all the tickets are read in a single batch before any of
+        them are parsed, rather than interleaving file access with parsing.
+        Since reading is I/O-bound, the files are read concurrently, unless
+        there are only a few; parsing happens afterwards, in order. Tickets
+        which have already been loaded are skipped.
+
+        Raises:
+            KeyError: If any number doesn't correspond to an existing ticket
+        """
+        numbers_to_load = [number for number in numbers if number not in self]
+
+        if not numbers_to_load:
+            return
+
+        if len(numbers_to_load) < MIN_CONCURRENT_TICKET_FILES:
+            all_contents = [self.read(number) for number in numbers_to_load]
+        else:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                # Consuming the results propagates any errors raised while reading
+                all_contents = list(executor.map(self.read, numbers_to_load))
+
+        for number, contents in zip(numbers_to_load, all_contents):
+            self[number] = self.parse(number, contents)
+
 
 class RepoManager:
-    """Handles direct interaction with the `git` repo"""
+    """Handles direct interaction with the `git` repo
 
-    def __init__(self):
-        self.repo = git.Repo(search_parent_directories=True)
+    The repo itself is only located & opened once something actually needs it,
+    so that e.g. searching a custom tickets dir doesn't touch `git` at all.
+    """
+
+    @functools.cached_property
+    def repo(self) -> "git.Repo":
+        """The current repo"""
+        # `gitpython` is slow to import, so only do so once it's actually needed
+        import git
+
+        return git.Repo(search_parent_directories=True)
+
+    @staticmethod
+    def _diff_path(diff: "git.Diff") -> pathlib.Path:
+        """The path of the file that a diff applies to"""
+        # Diffs against the index record the file's path on both sides, even for
+        # added or deleted files, so it's never missing here
+        assert diff.b_path is not None
+
+        return pathlib.Path(diff.b_path)
 
     @property
     def staged_paths(self) -> list[pathlib.Path]:
         """The paths of files that have staged modifications"""
         return [
-            pathlib.Path(diff.b_path)
+            self._diff_path(diff)
             for diff in self.repo.index.diff(self.repo.head.commit)
         ]
 
     @property
     def unstaged_paths(self) -> list[pathlib.Path]:
         """The paths of tracked files that have unstaged modifications"""
-        return [pathlib.Path(diff.b_path) for diff in self.repo.index.diff(None)]
+        return [self._diff_path(diff) for diff in self.repo.index.diff(None)]
 
     @property
     def untracked_paths(self) -> list[pathlib.Path]:
         """The paths of untracked files"""
         return [pathlib.Path(path) for path in self.repo.untracked_files]
 
-    def get_branch(self, name: str, create: bool = True) -> typing.Optional[git.Head]:
+    def get_branch(self, name: str, create: bool = True) -> typing.Optional["git.Head"]:
         """Get the branch with the input name, optionally creating one if none exist
 
         Args:
@@ -238,7 +474,9 @@ class RepoManager:
             and one was not created.
         """
         try:
-            return self.repo.branches[name]
+            # `heads` is the same list as `branches`, but is typed as a property
+            # (`branches` is an alias that type checkers see as a method)
+            return self.repo.heads[name]
         # Indicates that the requested branch name doesn't exist
         except IndexError:
             if create:
@@ -246,18 +484,32 @@ class RepoManager:
             else:
                 return None
 
-    def branch_exists(self, branch_name: str) -> bool:
-        """Does a branch with this name exist?"""
-        return self.get_branch(branch_name, create=False) is not None
+    @property
+    def branch_names(self) -> set[str]:
+        """The names of all the branches that exist"""
+        return {branch.name for branch in self.repo.heads}
 
     @functools.cached_property
     def git_dir(self) -> pathlib.Path:
         """The root of the current repo"""
-        return pathlib.Path(self.repo.working_tree_dir)
+        working_tree_dir = self.repo.working_tree_dir
+        # Only bare repos lack a working tree, and tickets can't be edited in those
+        assert working_tree_dir is not None
+
+        return pathlib.Path(working_tree_dir)
 
     def stage(self, path: pathlib.Path):
         """Stage any modifications to this file"""
-        self.repo.index.add(str(path))
+        self.stage_many([path])
+
+    def stage_many(self, paths: list[pathlib.Path]):
+        """Stage any modifications to these files
+
+        All the files are added in a single index update, rather than reading &
+        writing the index once per file.
+        """
+        if paths:
+            self.repo.index.add([str(path) for path in paths])
 
     def commit(self, message: str):
         """Commit any staged modifications"""
@@ -289,20 +541,52 @@ class TicketStore:
         """
         self.repo_manager = RepoManager()
 
-        self._tickets_dir = tickets_dir
+        # The ticket storage directory; defaults to a repo-specific location
+        self.tickets_dir: pathlib.Path = tickets_dir or (
+            self.repo_manager.git_dir / pathlib.Path(".gira")
+        )
         self.search_conditions: typing.Optional[SearchConditions] = None
 
-        self.lazy_ticket_store = LazyTicketStore(
-            # Because this is a cached property, it's not actually accessed (so
-            # the map isn't actually created) until it's needed
-            self.ticket_path_components_by_number,
-            self.tickets_dir,
-        )
+    def _is_cached(self, name: str) -> bool:
+        """Has a cached property of the store already been computed?
+
+        Args:
+            name: The name of the `functools.cached_property` to check
+        """
+        # Cached properties store their values in the instance dict, under their
+        # own names, once they've been computed
+        return name in self.__dict__
+
+    def _clear_cached(self, name: str) -> None:
+        """Discard a cached property's value, if any, so it's recomputed next time
+
+        Args:
+            name: The name of the `functools.cached_property` to clear
+        """
+        self.__dict__.pop(name, None)
+
+    @functools.cached_property
+    def lazy_ticket_store(self) -> LazyTicketStore:
+        """The internal store that lazily loads tickets
+
+        Creating it requires scanning the ticket dir, so this is deferred until
+        a ticket is actually needed.
+        """
+        return LazyTicketStore(self.ticket_path_components_by_number, self.tickets_dir)
 
     def stage(self, target_ticket: ticket.Ticket):
         """Stage this ticket's file"""
         self.repo_manager.stage(self.relative_ticket_path(target_ticket))
 
+    def stage_many(self, target_tickets: collections.abc.Iterable[ticket.Ticket]):
+        """Stage these tickets' files, all at once"""
+        self.repo_manager.stage_many(
+            [
+                self.relative_ticket_path(target_ticket)
+                for target_ticket in target_tickets
+            ]
+        )
+
     @functools.cached_property
     def staged_nonticket_files(self) -> list[pathlib.Path]:
         """Staged files that do not correspond to tickets"""
@@ -329,54 +613,113 @@ class TicketStore:
         return list(self._unstaged_ticket_numbers)
 
     @functools.cached_property
-    def tickets_dir(self) -> pathlib.Path:
-        """The ticket storage directory in the current repo"""
-        if self._tickets_dir:
-            return self._tickets_dir
+    def _tickets_dir_prefix_length(self) -> int:
+        """The length of the ticket dir path, including a trailing separator"""
+        return len(os.path.join(self.tickets_dir, ""))
+
+    def _ticket_file_path_components(
+        self, ticket_path: str
+    ) -> ticket_properties.PathComponents:
+        """Extract the path components from a path found by walking the ticket dir
+
+        Every such path starts with the ticket dir, so it can just be sliced off,
+        rather than using `os.path.relpath`, which normalizes both paths.
 
-        return self.repo_manager.git_dir / pathlib.Path(".gira")
+        Raises:
+            MalformedTicket:
+                If required information can't be extracted from the ticket path
+        """
+        return ticket_properties.PathComponents.from_path(
+            pathlib.Path(ticket_path[self._tickets_dir_prefix_length :])
+        )
 
     @property
     def _all_ticket_path_components(
         self,
     ) -> collections.abc.Iterator[ticket_properties.PathComponents]:
         """Yields all the valid ticket path component containers in the ticket dir"""
-        for ticket_path in self.tickets_dir.rglob(
-            f"*{ticket_properties.TICKET_FILE_SUFFIX}"
-        ):
+        for ticket_path in walk_ticket_files(str(self.tickets_dir)):
             try:
-                yield ticket_properties.PathComponents.from_path(
-                    ticket_path.relative_to(self.tickets_dir)
-                )
+                yield self._ticket_file_path_components(ticket_path)
             # Ignore any bad ticket files
             except ticket_properties.MalformedTicket:
                 continue
 
-    @functools.cached_property
-    def all_ticket_path_components(self) -> list[ticket_properties.PathComponents]:
-        """A list of all the valid ticket path component containers in the ticket dir"""
-        return list(self._all_ticket_path_components)
+    def find_ticket_path_components(
+        self, number: int
+    ) -> typing.Optional[ticket_properties.PathComponents]:
+        """Find the path component container for a specific ticket, if it exists
+
+        If the ticket dir hasn't already been fully scanned, this stops scanning
+        as soon as the ticket is found, rather than indexing every ticket.
+
+        Args:
+            number: The number of the ticket to find
+        """
+        if self._is_cached("ticket_path_components_by_number"):
+            return self.ticket_path_components_by_number.get(number)
+
+        for ticket_path in walk_ticket_files(str(self.tickets_dir)):
+            # Only the filename's number is checked until the ticket is found;
+            # it's compared as an `int`, since ticket numbers may be zero-padded
+            match = ticket_properties.TICKET_FILE_REGEX.match(
+                os.path.basename(ticket_path)
+            )
+
+            if match and int(match.group("number")) == number:
+                return self._ticket_file_path_components(ticket_path)
+
+        return None
 
     @functools.cached_property
     def ticket_path_components_by_number(
         self,
     ) -> dict[int, ticket_properties.PathComponents]:
-        """A map from ticket numbers to containers of path component information"""
+        """A map from ticket numbers to containers of path component information
+
+        The map is built in order of ticket number, so iterating over it (or over
+        `all_ticket_numbers`) visits the tickets in order without re-sorting.
+        """
         return {
             path_component.number: path_component
-            for path_component in self.all_ticket_path_components
+            for path_component in sorted(
+                self._all_ticket_path_components,
+                key=operator.attrgetter("number"),
+            )
         }
 
-    @functools.cached_property
-    def all_ticket_numbers(self) -> set[int]:
-        """The numbers of all tickets that exist"""
-        return set(self.ticket_path_components_by_number.keys())
-
     @property
+    def all_ticket_numbers(self) -> collections.abc.KeysView[int]:
+        """The numbers of all tickets that exist, in ascending order
+
+        This is a view of the ticket index's keys, so it supports fast membership
+        tests without copying the numbers into a separate set
+        """
+        return self.ticket_path_components_by_number.keys()
+
+    @functools.cached_property
     def next_ticket_number(self) -> int:
-        """The number that should be used for a newly-created ticket"""
+        """The number that should be used for a newly-created ticket
+
+        If the ticket dir hasn't already been indexed, this only extracts the
+        number from each ticket filename, without building the full index.
+        """
+        if self._is_cached("ticket_path_components_by_number"):
+            ticket_numbers: collections.abc.Iterable[int] = self.all_ticket_numbers
+        else:
+            ticket_numbers = (
+                int(match.group("number"))
+                for match in (
+                    ticket_properties.TICKET_FILE_REGEX.match(
+                        os.path.basename(ticket_path)
+                    )
+                    for ticket_path in walk_ticket_files(str(self.tickets_dir))
+                )
+                if match
+            )
+
         # Default to -1 so the result is 0 if there are no tickets
-        return max(self.all_ticket_numbers, default=-1) + 1
+        return max(ticket_numbers, default=-1) + 1
 
     def get_ticket(self, number: int) -> ticket.Ticket:
         """Retrieve a ticket by number
@@ -395,39 +738,157 @@ class TicketStore:
 
     @property
     def _all_tickets(self) -> collections.abc.Iterator[ticket.Ticket]:
-        """All tickets in the current repo"""
+        """All tickets in the current repo, in order of ticket number"""
+        self.lazy_ticket_store.load(self.all_ticket_numbers)
+
+        # The numbers are already in order, so the tickets don't need to be sorted
         for ticket_number in self.all_ticket_numbers:
             yield self.get_ticket(ticket_number)
 
     @functools.cached_property
     def all_tickets(self) -> list[ticket.Ticket]:
-        """All tickets in the current repo"""
-        return sorted(list(self._all_tickets), key=lambda ticket: ticket.number)
+        """All tickets in the current repo, in order of ticket number"""
+        return list(self._all_tickets)
 
     def set_search_conditions(self, search_conditions: SearchConditions) -> None:
-        """Set the conditions for ticket filtering"""
+        """Set the conditions for ticket filtering
+
+        Any previously-filtered tickets are discarded, so they're filtered anew
+        under the new conditions when next accessed.
+        """
         self.search_conditions = search_conditions
 
-    @property
-    def _filtered_tickets(self) -> collections.abc.Iterator[ticket.Ticket]:
-        """Tickets matching the set filtering conditions"""
-        for ticket in self.all_tickets:
-            if self.search_conditions and self.search_conditions.ticket_matches(ticket):
-                yield ticket
+        for cached_attribute in ("filtered_tickets", "filtered_ticket_numbers"):
+            self._clear_cached(cached_attribute)
+
+    def _path_matching_ticket_numbers(
+        self, search_conditions: SearchConditions
+    ) -> collections.abc.Iterator[int]:
+        """The numbers of tickets whose paths match the filtering conditions
+
+        Only the ticket path components are checked, so no tickets are loaded.
+
+        Args:
+            search_conditions: The conditions to check the ticket paths against
+        """
+        # If specific ticket numbers are requested, only those tickets can match,
+        # so there's no need to consider every other ticket
+        if search_conditions.numbers:
+            candidate_numbers: collections.abc.Iterable[int] = (
+                number
+                for number in sorted(set(search_conditions.numbers))
+                if number in self.all_ticket_numbers
+            )
+        else:
+            candidate_numbers = self.all_ticket_numbers
+
+        for number in candidate_numbers:
+            if search_conditions.path_matches(
+                self.ticket_path_components_by_number[number]
+            ):
+                yield number
+
+    def _filter_tickets(
+        self, load_all_at_once: bool
+    ) -> collections.abc.Iterator[ticket.Ticket]:
+        """Tickets matching the set filtering conditions
+
+        Args:
+            load_all_at_once: Should every candidate ticket be loaded before any
+                are tested, or should each be loaded only once it's reached?
+        """
+        search_conditions = self.search_conditions
+        if not search_conditions:
+            return
+
+        # Tickets ruled out by their paths alone never need to be loaded
+        candidate_numbers = list(self._path_matching_ticket_numbers(search_conditions))
+
+        if load_all_at_once:
+            self.lazy_ticket_store.load(candidate_numbers)
+
+        # Tickets that pass the path checks can only fail on their contents
+        check_contents = not search_conditions.only_path_conditions
+
+        for number in candidate_numbers:
+            candidate_ticket = self.get_ticket(number)
+
+            if not check_contents or search_conditions.ticket_matches(candidate_ticket):
+                yield candidate_ticket
+
+    def _filtered_ticket_numbers_from_paths(
+        self,
+    ) -> typing.Optional[collections.abc.Iterator[int]]:
+        """Find the filtered ticket numbers without loading any tickets, if possible
+
+        Returns:
+            The matching ticket numbers, if the conditions can all be checked from
+            ticket paths alone, or `None` if the tickets' contents need to be
+            checked (or the filtered tickets have already been loaded anyway)
+        """
+        search_conditions = self.search_conditions
+
+        if (
+            self._is_cached("filtered_tickets")
+            or not search_conditions
+            or not search_conditions.only_path_conditions
+        ):
+            return None
+
+        return self._path_matching_ticket_numbers(search_conditions)
 
     @functools.cached_property
     def filtered_tickets(self) -> list[ticket.Ticket]:
         """Tickets matching the set filtering conditions, if any"""
-        return sorted(list(self._filtered_tickets), key=lambda ticket: ticket.number)
+        # Since all tickets are already sorted, the filtered tickets will be too
+        return list(self._filter_tickets(load_all_at_once=True))
+
+    def iter_filtered_tickets(self) -> collections.abc.Iterator[ticket.Ticket]:
+        """Lazily yield the tickets matching the set filtering conditions, if any
+
+        Unlike `filtered_tickets`, tickets are only loaded as they're reached, so
+        the first matches are available without waiting for every ticket to be
+        loaded & tested.
+        """
+        if self._is_cached("filtered_tickets"):
+            return iter(self.filtered_tickets)
+
+        return self._filter_tickets(load_all_at_once=False)
+
+    def count_filtered_tickets(self, limit: int) -> int:
+        """Count the tickets matching the set filtering conditions, up to a limit
+
+        Searching stops once the limit is reached, so e.g. checking whether more
+        than one ticket matches only requires finding the first two matches.
+        """
+        filtered_numbers = self._filtered_ticket_numbers_from_paths()
+        matches: collections.abc.Iterable = (
+            self.iter_filtered_tickets()
+            if filtered_numbers is None
+            else filtered_numbers
+        )
+
+        return sum(1 for _ in itertools.islice(matches, limit))
 
     @functools.cached_property
     def filtered_ticket_numbers(self) -> list[int]:
         """The numbers of tickets matching the set filtering conditions, if any"""
+        filtered_numbers = self._filtered_ticket_numbers_from_paths()
+        if filtered_numbers is not None:
+            return list(filtered_numbers)
+
         return [filtered_ticket.number for filtered_ticket in self.filtered_tickets]
 
+    @functools.cached_property
+    def relative_tickets_dir(self) -> pathlib.Path:
+        """The path, from the current working directory, to the ticket dir"""
+        return pathlib.Path(os.path.relpath(self.tickets_dir))
+
     def relative_ticket_path(self, existing_ticket: ticket.Ticket) -> pathlib.Path:
         """The path, from the current working directory, to the ticket file"""
-        return pathlib.Path(os.path.relpath(self.tickets_dir / existing_ticket.path))
+        # Only the ticket dir needs to be relativized: ticket paths are already
+        # relative to it
+        return self.relative_tickets_dir / existing_ticket.path
 
     def write(self, modified_ticket: ticket.Ticket, stage: bool):
         """Write the contents of a ticket to disk
@@ -443,3 +904,28 @@ class TicketStore:
 
         if stage:
             self.stage(modified_ticket)
+
+    def write_many(self, modified_tickets: list[ticket.Ticket], stage: bool):
+        """Write the contents of multiple tickets to disk
+
+        Unless there are only a few, the files are written concurrently, since
+        each one is independent; any staging happens afterwards, because the
+        `git` index can't be safely updated from multiple threads.
+
+        Args:
+            modified_tickets: The tickets whose contents should be written out
+            stage: Should the modifications be staged?
+        """
+        write_unstaged = functools.partial(self.write, stage=False)
+
+        if len(modified_tickets) < MIN_CONCURRENT_TICKET_FILES:
+            for modified_ticket in modified_tickets:
+                write_unstaged(modified_ticket)
+        else:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                # Consume the results so that any errors raised while writing are
+                # propagated
+                list(executor.map(write_unstaged, modified_tickets))
+
+        if stage:
+            self.stage_many(modified_tickets)
@@ -4,7 +4,7 @@ setup(
     name="gira",
     version="1.0.0",
     packages=find_packages(),
-    install_requires=["Click", "gitpython", "python-slugify", "marko", "tabulate"],
+    install_requires=["Click", "gitpython", "python-slugify", "marko"],
     entry_points="""
         [console_scripts]
         gira=cli:cli